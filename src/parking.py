@@ -1,36 +1,178 @@
-"""Module for managing a parking lot system with vehicles and parking spots."""
+"""
+Module for managing a parking lot system with vehicles and parking spots.
+
+The module type-checks cleanly so it can be compiled with mypyc
+(``mypyc src/parking.py``) into a drop-in extension module. Compiled
+builds enforce argument annotations at the call boundary, so parameters
+that a method validates itself are annotated as ``object``; bad values
+then raise the errors documented below in both builds.
+
+All spots are ``ParkingSpot`` instances. ``StandardParkingSpot`` and
+``ElectricVehicleParkingSpot`` are factory functions kept for older code,
+not classes, so they cannot be used with ``isinstance``; check
+``spot.spot_type`` instead.
+"""
 
 from __future__ import annotations
-import copy
+import contextlib
+import sys
 import threading
-from typing import Optional, Dict, Set, Callable, List, Any
-from abc import ABC, abstractmethod
+from typing import Optional, Dict, Set, Callable, Any, Tuple, List, Iterable, ContextManager, final
+
+__all__ = [
+    "MAX_SPOT_ID",
+    "ParkingLot",
+    "Vehicle",
+    "ParkingSpot",
+    "BaseParkingSpot",
+    "StandardParkingSpot",
+    "ElectricVehicleParkingSpot",
+]
+
+# Spot kinds. They double as the values stored in ParkingLot._free, where 0
+# marks a spot ID that is occupied or was never added.
+_STANDARD = 1
+_ELECTRIC = 2
+_SPOT_KINDS: Dict[str, int] = {"standard": _STANDARD, "electric": _ELECTRIC}
+
+# Largest accepted spot ID. ParkingLot._free holds one byte per ID up to the
+# highest one added, so this caps it at about 1 MB.
+MAX_SPOT_ID = 1_000_000
+
+# Zeros that ParkingLot._free is grown from, a page at a time.
+_ZERO_PAGE = memoryview(bytes(1 << 16))
+
+
+def _spot_kind(spot_type: object) -> int:
+    """
+    Map a public spot type name to its spot-kind code.
+    
+    Args:
+        spot_type (object): 'standard' or 'electric'.
+    
+    Returns:
+        int: The spot-kind code.
+    
+    Raises:
+        ValueError: If the spot type is unknown.
+    """
+    kind = _SPOT_KINDS.get(spot_type) if type(spot_type) is str else None
+    if kind is None:
+        raise ValueError(f"Unknown parking spot type: {spot_type}")
+    return kind
+
+
+def _spot_key(spot_id: object) -> int:
+    """
+    Normalize a caller's spot ID for adding or looking up spots.
+    
+    Any int other than a bool from 0 to ``MAX_SPOT_ID`` is accepted, so
+    int subclasses such as ``IntEnum`` members are stored and found as
+    plain ints.
+    
+    Args:
+        spot_id (object): The spot ID as passed by the caller.
+    
+    Returns:
+        int: The spot ID as a plain int, or -1 if it is not a valid spot ID.
+    """
+    # bool is tested first: once narrowed to int, a compiled build no
+    # longer tells the two apart.
+    if type(spot_id) is bool or not isinstance(spot_id, int):
+        return -1
+    return int(spot_id) if 0 <= spot_id <= MAX_SPOT_ID else -1
 
 
 class ParkingLot:
-    """Represents a parking lot with multiple parking spots."""
-    parking_spots: Dict[int, BaseParkingSpot]
+    """
+    Represents a parking lot with multiple parking spots.
+    
+    Spots in ``parking_spots`` belong to the lot and must only be changed
+    through its methods. Parking or unparking such a spot directly bypasses
+    the lot's availability index and its cached ``repr``.
+    """
+    parking_spots: Dict[int, ParkingSpot]
     vehicle_to_spot: Dict[str, int]  # Reverse lookup for fast search
-    available_spots: Set[int]
+    _free: bytearray  # _free[spot_id] holds the spot's kind while it is available
 
-    def __init__(self) -> None:
-        """Initialize an empty parking lot and a reentrant lock."""
+    def __init__(self, allocation: str = "nearest", thread_safe: bool = True) -> None:
+        """
+        Initialize an empty parking lot and its lock.
+        
+        Args:
+            allocation (str): How spots are picked when none is requested:
+                'nearest' takes the lowest free spot ID (closest to the gate),
+                'farthest' takes the highest.
+            thread_safe (bool): Guard state with a lock. Pass False only when
+                the lot is used from a single thread.
+        
+        Raises:
+            ValueError: If the allocation policy is unknown.
+        """
         self.parking_spots = {}
         self.vehicle_to_spot = {}
-        self.available_spots = set()
-        self._lock = threading.RLock()
-        self._callbacks: Dict[str, List[Callable[..., None]]] = {}
+        self._free = bytearray()
+        # Bound to this bytearray, so _free must only ever be grown in place.
+        if allocation == "nearest":
+            self._find_free: Callable[[int], int] = self._free.find
+        elif allocation == "farthest":
+            self._find_free = self._free.rfind
+        else:
+            raise ValueError(f"Unknown allocation policy: {allocation}")
+        self._lock: ContextManager[Any] = (
+            threading.Lock() if thread_safe else contextlib.nullcontext()
+        )
+        # Copy-on-write: handler tuples are replaced, never mutated in place.
+        self._callbacks: Dict[str, Tuple[Callable[..., None], ...]] = {}
+        self._version = 0  # Bumped on every change that affects __repr__
+        self._repr_cache: Tuple[str, int] = ("", -1)
 
     def __repr__(self) -> str:
-        """Return a string representation of the parking lot's status."""
+        """
+        Return a string representation of the parking lot's status.
+        
+        The text is cached until the lot's own methods next change a spot.
+        """
         with self._lock:
+            cached, version = self._repr_cache
+            if version == self._version:
+                return cached
             if not self.parking_spots:
-                return "uninitialized lot"
-            lot_info = "\n".join(
-                f"{spot_id}: {spot.vehicle.vehicle_type if spot.vehicle else 'empty'}"
-                for spot_id, spot in self.parking_spots.items()
-            )
-            return f"-----------\n{lot_info}\n-----------"
+                text = "uninitialized lot"
+            else:
+                lot_info = "\n".join([
+                    f"{spot_id}: {spot._vehicle_type or 'empty'}"
+                    for spot_id, spot in self.parking_spots.items()
+                ])
+                text = f"-----------\n{lot_info}\n-----------"
+            self._repr_cache = (text, self._version)
+            return text
+
+    @property
+    def available_spots(self) -> Set[int]:
+        """
+        Return the IDs of all currently available spots.
+        
+        Returns:
+            Set[int]: A new set; modifying it does not affect the lot.
+        """
+        with self._lock:
+            return {spot_id for spot_id in self.parking_spots if self._free[spot_id]}
+
+    def spot_of(self, vehicle_id: str) -> Optional[ParkingSpot]:
+        """
+        Look up the spot a vehicle is parked in.
+        
+        Args:
+            vehicle_id (str): The unique identifier of the vehicle.
+        
+        Returns:
+            Optional[ParkingSpot]: The spot holding the vehicle, or None if
+            the vehicle is not parked here.
+        """
+        with self._lock:
+            spot_id = self.vehicle_to_spot.get(vehicle_id)
+            return None if spot_id is None else self.parking_spots[spot_id]
 
     def register_callback(self, event: str, callback: Callable[..., None]) -> None:
         """
@@ -40,10 +182,9 @@ class ParkingLot:
             event (str): The event name (e.g., 'vehicle_parked', 'vehicle_unparked').
             callback (Callable[..., None]): The callback function to invoke.
         """
+        event = sys.intern(event)
         with self._lock:
-            if event not in self._callbacks:
-                self._callbacks[event] = []
-            self._callbacks[event].append(callback)
+            self._callbacks[event] = self._callbacks.get(event, ()) + (callback,)
 
     def unregister_callback(self, event: str, callback: Callable[..., None]) -> None:
         """
@@ -54,101 +195,185 @@ class ParkingLot:
             callback (Callable[..., None]): The callback function to remove.
         """
         with self._lock:
-            if event in self._callbacks and callback in self._callbacks[event]:
-                self._callbacks[event].remove(callback)
+            callbacks = self._callbacks.get(event, ())
+            if callback in callbacks:
+                index = callbacks.index(callback)
+                self._callbacks[event] = callbacks[:index] + callbacks[index + 1:]
 
     def _trigger_event(self, event: str, *args: Any, **kwargs: Any) -> None:
         """
         Trigger all callbacks registered for the given event.
         
+        The handler tuple is replaced rather than mutated on registration, so
+        fetching it is atomic and needs no lock. Callbacks therefore run
+        outside the lock and may call back into the lot; callers must not
+        hold ``self._lock``.
+        
         Args:
             event (str): The event name.
             *args, **kwargs: Arguments to pass to the callbacks.
         """
-        with self._lock:
-            for callback in self._callbacks.get(event, []):
-                callback(*args, **kwargs)
+        for callback in self._callbacks.get(event, ()):
+            callback(*args, **kwargs)
 
-    def _find_available_spot(self) -> BaseParkingSpot:
+    def _find_available_spot(self, vehicle: Vehicle) -> ParkingSpot:
         """
-        Find the first available parking spot.
+        Find the available parking spot that fits the vehicle.
+        
+        The allocation policy picks the lowest or highest free spot ID.
+        Electric vehicles prefer electric spots and fall back to standard
+        ones; other vehicles only get standard spots. The spot stays marked
+        as available until a vehicle is actually parked in it. Must be
+        called with ``self._lock`` held.
+        
+        Args:
+            vehicle (Vehicle): The vehicle looking for a spot.
         
         Returns:
-            BaseParkingSpot: A free parking spot.
+            ParkingSpot: A free parking spot.
         
         Raises:
-            RuntimeError: If no available spots are left.
-        """
-        with self._lock:
-            if not self.available_spots:
+            RuntimeError: If no suitable spots are left.
+        """
+        spot_id = -1
+        if vehicle.vehicle_type == "electric":
+            spot_id = self._find_free(_ELECTRIC)
+        if spot_id < 0:
+            spot_id = self._find_free(_STANDARD)
+            if spot_id < 0:
                 raise RuntimeError("No available spots left.")
-            spot_id = self.available_spots.pop()
-            spot = self._get_spot_or_raise(spot_id)
-            return spot
+        return self.parking_spots[spot_id]
 
-    def _get_spot_or_raise(self, spot_id: int) -> BaseParkingSpot:
+    def _get_spot_or_raise(self, spot_id: object) -> ParkingSpot:
         """
-        Validate and retrieve a parking spot.
+        Retrieve a parking spot.
+        
+        ``spot_id`` may come straight from a caller, so it is normalized
+        with the same rules ``add_spot`` applies; anything they reject is an
+        unknown spot. Must be called with ``self._lock`` held.
         
         Args:
             spot_id (int): The identifier of the parking spot.
         
         Returns:
-            BaseParkingSpot: The parking spot object.
+            ParkingSpot: The parking spot object.
         
         Raises:
-            ValueError: If the spot ID is invalid or does not exist.
+            ValueError: If the spot ID is invalid or the spot does not exist.
         """
-        with self._lock:
-            if not isinstance(spot_id, int) or spot_id < 0:
-                raise ValueError("Spot ID must be a non-negative integer.")
-            if spot_id not in self.parking_spots:
-                raise ValueError(f"Invalid spot ID: {spot_id}. The spot does not exist.")
-            return self.parking_spots[spot_id]
+        spot = self.parking_spots.get(_spot_key(spot_id))
+        if spot is None:
+            raise ValueError(f"Invalid spot ID: {spot_id}. The spot does not exist.")
+        return spot
 
-    def add_spot(self, spot_id: int, spot_type: str = "standard") -> Optional[BaseParkingSpot]:
+    def _grow_free(self, top: int) -> None:
+        """
+        Extend ``_free`` in place so that ``top`` is a valid index.
+        
+        New IDs start out unavailable. The array is grown from a shared page
+        of zeros rather than a temporary ``bytes`` of the full gap. Must be
+        called with ``self._lock`` held.
+        
+        Args:
+            top (int): The highest spot ID the array must cover.
+        """
+        free = self._free
+        while len(free) <= top:
+            free.extend(_ZERO_PAGE[:top + 1 - len(free)])
+
+    def add_spot(self, spot_id: object, spot_type: object = "standard") -> Optional[ParkingSpot]:
         """
         Add a parking spot to the lot.
         
+        Availability is tracked in a flag array indexed by spot ID, so spot
+        IDs must not exceed ``MAX_SPOT_ID`` and are best kept dense.
+        
         Args:
             spot_id (int): The unique identifier of the parking spot.
             spot_type (str): The type of parking spot ('standard' or 'electric').
         
         Returns:
-            Optional[BaseParkingSpot]: The newly created parking spot or None if it already exists.
+            Optional[ParkingSpot]: The newly created parking spot or None if it already exists.
         
         Raises:
-            ValueError: If the spot ID is invalid or the spot type is unknown.
+            ValueError: If the spot ID is not an integer from 0 to
+                ``MAX_SPOT_ID`` or the spot type is unknown.
         """
+        key = _spot_key(spot_id)
+        if key < 0:
+            raise ValueError(f"Spot ID must be a non-negative integer up to {MAX_SPOT_ID}.")
         with self._lock:
-            if not isinstance(spot_id, int) or spot_id < 0:
-                raise ValueError("Spot ID must be a non-negative integer.")
-            if spot_id in self.parking_spots:
+            if key in self.parking_spots:
                 return None  # Spot already exists
-            if spot_type == "standard":
-                spot = StandardParkingSpot(spot_id)
-            elif spot_type == "electric":
-                spot = ElectricVehicleParkingSpot(spot_id)
-            else:
-                raise ValueError(f"Unknown parking spot type: {spot_type}")
-            self.parking_spots[spot_id] = spot
-            self.available_spots.add(spot_id)
+            spot = ParkingSpot(key, spot_type, charging_port=spot_type == "electric")
+            self._grow_free(key)
+            self.parking_spots[key] = spot
+            self._free[key] = spot.kind
+            self._version += 1
             return spot
 
-    def take_snapshot(self) -> Dict[int, BaseParkingSpot]:
+    def add_spots(self, spot_ids: Iterable[object], spot_type: object = "standard") -> List[ParkingSpot]:
+        """
+        Add several parking spots of the same type in one call.
+        
+        All IDs are validated before the lot is touched; IDs that already
+        exist are skipped.
+        
+        Args:
+            spot_ids (Iterable[int]): The unique identifiers of the new spots.
+            spot_type (str): The type of parking spot ('standard' or 'electric').
+        
+        Returns:
+            List[ParkingSpot]: The newly created parking spots.
+        
+        Raises:
+            ValueError: If any spot ID is not an integer from 0 to
+                ``MAX_SPOT_ID`` or the spot type is unknown.
+        """
+        kind = _spot_kind(spot_type)
+        charging_port = kind == _ELECTRIC
+        ids: List[int] = []
+        for spot_id in spot_ids:
+            key = _spot_key(spot_id)
+            if key < 0:
+                raise ValueError(f"Spot ID must be a non-negative integer up to {MAX_SPOT_ID}.")
+            ids.append(key)
+        with self._lock:
+            new_spots = {
+                spot_id: ParkingSpot(spot_id, spot_type, charging_port)
+                for spot_id in ids
+                if spot_id not in self.parking_spots
+            }
+            if not new_spots:
+                return []
+            self._grow_free(max(new_spots))
+            self.parking_spots.update(new_spots)
+            for spot_id in new_spots:
+                self._free[spot_id] = kind
+            self._version += 1
+            return list(new_spots.values())
+
+    def take_snapshot(self) -> Dict[int, ParkingSpot]:
         """
-        Take a deep copy snapshot of the current parking lot state.
+        Take a snapshot of the current parking lot state.
+        
+        Each spot is cloned so later parking changes do not affect the
+        snapshot. Vehicles are treated as immutable and shared by reference.
         
         Returns:
-            Dict[int, BaseParkingSpot]: A deep copy of the parking spots.
+            Dict[int, ParkingSpot]: Copies of the parking spots keyed by spot ID.
         """
         with self._lock:
-            return copy.deepcopy(self.parking_spots)
+            return {spot_id: spot.clone() for spot_id, spot in self.parking_spots.items()}
 
-    def park_vehicle(self, vehicle: Vehicle, spot_id: Optional[int] = None) -> None:
+    def park_vehicle(self, vehicle: object, spot_id: object = None) -> None:
         """
         Park a vehicle in the lot.
         
+        Validation, spot lookup and the state update happen in a single
+        critical section, without re-running the spot's own
+        ``park_vehicle`` checks.
+        
         Args:
             vehicle (Vehicle): The vehicle to be parked.
             spot_id (Optional[int]): The specific spot to park in (if provided).
@@ -156,42 +381,110 @@ class ParkingLot:
         Raises:
             TypeError: If the vehicle is not a Vehicle instance.
             RuntimeError: If the vehicle is already parked.
-            ValueError: If the spot is occupied or does not exist.
+            ValueError: If the spot ID is invalid, or the spot is occupied or does not exist.
         """
         with self._lock:
-            if not isinstance(vehicle, Vehicle):
-                raise TypeError("Expected a Vehicle instance.")
-            if vehicle.vehicle_id in self.vehicle_to_spot:
-                raise RuntimeError("Vehicle already parked.")
-            if spot_id is None:
-                spot = self._find_available_spot()
-            else:
-                spot = self._get_spot_or_raise(spot_id)
-                if not spot.is_available:
-                    raise ValueError(f"Spot {spot.spot_id} is already occupied.")
-            spot.park_vehicle(vehicle)
-            self.vehicle_to_spot[vehicle.vehicle_id] = spot.spot_id
-            self.available_spots.discard(spot.spot_id)
-            self._trigger_event("vehicle_parked", vehicle=vehicle, spot=spot)
+            spot = self._park_in_spot(vehicle, spot_id)
+        self._trigger_event("vehicle_parked", vehicle=vehicle, spot=spot)
 
-    def _free_spot(self, spot: BaseParkingSpot) -> None:
+    def park_vehicles(self, vehicles: Iterable[object]) -> None:
+        """
+        Park several vehicles, each in an automatically assigned spot.
+        
+        The lock is taken once for the whole batch, after ``vehicles`` has
+        been consumed, so the iterable may itself read the lot. Vehicles are
+        parked in order; if one fails, the ones before it stay parked.
+        
+        A ``vehicle_parked`` event is triggered for every vehicle parked,
+        even if a callback raises. The parking error, if any, is then
+        raised; otherwise the first callback error is.
+        
+        Args:
+            vehicles (Iterable[Vehicle]): The vehicles to be parked.
+        
+        Raises:
+            TypeError: If an item is not a Vehicle instance.
+            RuntimeError: If a vehicle is already parked or no suitable spot is left.
+        """
+        vehicles = list(vehicles)
+        parked: List[Tuple[object, ParkingSpot]] = []
+        error: Optional[Exception] = None
+        try:
+            with self._lock:
+                for vehicle in vehicles:
+                    parked.append((vehicle, self._park_in_spot(vehicle, None)))
+        except Exception as exc:
+            error = exc
+        for vehicle, spot in parked:
+            try:
+                self._trigger_event("vehicle_parked", vehicle=vehicle, spot=spot)
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        if error is not None:
+            raise error
+
+    def _park_in_spot(self, vehicle: object, spot_id: object) -> ParkingSpot:
+        """
+        Validate a vehicle and park it in the given or an assigned spot.
+        
+        Must be called with ``self._lock`` held; the caller is responsible
+        for triggering ``vehicle_parked`` once the lock is released.
+        
+        Args:
+            vehicle (Vehicle): The vehicle to be parked.
+            spot_id (Optional[int]): The specific spot to park in, or None to assign one.
+        
+        Returns:
+            ParkingSpot: The spot the vehicle was parked in.
+        
+        Raises:
+            TypeError: If the vehicle is not a Vehicle instance.
+            RuntimeError: If the vehicle is already parked or no suitable spot is left.
+            ValueError: If the spot is occupied, does not exist or does not accept the vehicle.
+        """
+        if type(vehicle) is not Vehicle:
+            raise TypeError("Expected a Vehicle instance.")
+        vehicle_id = vehicle.vehicle_id
+        if vehicle_id in self.vehicle_to_spot:
+            raise RuntimeError("Vehicle already parked.")
+        if spot_id is None:
+            spot = self._find_available_spot(vehicle)
+        else:
+            spot = self._get_spot_or_raise(spot_id)
+            if spot.vehicle is not None:
+                raise ValueError(f"Spot {spot.spot_id} is already occupied.")
+        spot._park(spot, vehicle)
+        self.vehicle_to_spot[vehicle_id] = spot.spot_id
+        self._free[spot.spot_id] = 0
+        self._version += 1
+        return spot
+
+    def _free_spot(self, spot: ParkingSpot) -> Vehicle:
         """
         Free a parking spot and update available spots.
         
+        Must be called with ``self._lock`` held; the caller is responsible
+        for triggering ``spot_freed`` once the lock is released.
+        
         Args:
-            spot (BaseParkingSpot): The parking spot to be freed.
+            spot (ParkingSpot): The parking spot to be freed.
+        
+        Returns:
+            Vehicle: The vehicle that was parked in the spot.
         
         Raises:
             RuntimeError: If the parking spot is already empty.
         """
-        with self._lock:
-            if spot.is_available:
-                raise RuntimeError(f"Spot {spot.spot_id} is already empty.")
-            spot.unpark_vehicle()
-            self.available_spots.add(spot.spot_id)
-            self._trigger_event("spot_freed", spot=spot)
+        vehicle = spot.vehicle
+        if vehicle is None:
+            raise RuntimeError(f"Spot {spot.spot_id} is already empty.")
+        spot.unpark_vehicle()
+        self._free[spot.spot_id] = spot.kind
+        self._version += 1
+        return vehicle
 
-    def unpark_vehicle(self, vehicle_id: str) -> None:
+    def unpark_vehicle(self, vehicle_id: object) -> None:
         """
         Unpark a vehicle from the parking lot.
         
@@ -202,16 +495,17 @@ class ParkingLot:
             ValueError: If the vehicle ID is invalid or the vehicle is not found.
         """
         with self._lock:
-            if not isinstance(vehicle_id, str) or not vehicle_id.strip():
+            if type(vehicle_id) is not str or not vehicle_id or vehicle_id.isspace():
                 raise ValueError("Invalid vehicle ID: must be a non-empty string.")
-            if vehicle_id not in self.vehicle_to_spot:
+            spot_id = self.vehicle_to_spot.pop(vehicle_id, None)
+            if spot_id is None:
                 raise ValueError(f"Vehicle {vehicle_id} not found")
-            spot_id = self.vehicle_to_spot.pop(vehicle_id)
             spot = self._get_spot_or_raise(spot_id)
             self._free_spot(spot)
-            self._trigger_event("vehicle_unparked", vehicle_id=vehicle_id, spot=spot)
+        self._trigger_event("spot_freed", spot=spot)
+        self._trigger_event("vehicle_unparked", vehicle_id=vehicle_id, spot=spot)
 
-    def release_spot(self, spot_id: int) -> None:
+    def release_spot(self, spot_id: object) -> None:
         """
         Release a parking spot, making it available again.
         
@@ -224,15 +518,24 @@ class ParkingLot:
         """
         with self._lock:
             spot = self._get_spot_or_raise(spot_id)
-            self._free_spot(spot)
+            vehicle = self._free_spot(spot)
+            self.vehicle_to_spot.pop(vehicle.vehicle_id, None)
+        self._trigger_event("spot_freed", spot=spot)
 
 
+@final
 class Vehicle:
-    """Represents a vehicle that can be parked in the parking lot."""
+    """
+    Represents a vehicle that can be parked in the parking lot.
+    
+    Parking APIs check for this exact type, so subclasses are not accepted.
+    """
+    __slots__ = ("vehicle_id", "vehicle_type", "vehicle_make", "vehicle_model", "vehicle_color", "_hash")
+
     def __init__(
         self,
-        vehicle_id: str,
-        vehicle_type: str,
+        vehicle_id: object,
+        vehicle_type: object,
         vehicle_make: Optional[str] = None,
         vehicle_model: Optional[str] = None,
         vehicle_color: Optional[str] = None
@@ -250,11 +553,13 @@ class Vehicle:
         Raises:
             ValueError: If vehicle_id or vehicle_type are empty or invalid.
         """
-        if not isinstance(vehicle_id, str) or not vehicle_id.strip():
+        if type(vehicle_id) is not str or not vehicle_id or vehicle_id.isspace():
             raise ValueError("Vehicle ID must be a non-empty string.")
-        if not isinstance(vehicle_type, str) or not vehicle_type.strip():
+        if type(vehicle_type) is not str or not vehicle_type or vehicle_type.isspace():
             raise ValueError("Vehicle type must be a non-empty string.")
-        self.vehicle_id = vehicle_id
+        # Interned so lot lookups keyed by vehicle_id can match on identity.
+        self.vehicle_id = sys.intern(vehicle_id)
+        self._hash = hash(self.vehicle_id)
         self.vehicle_type = vehicle_type
         self.vehicle_make = vehicle_make
         self.vehicle_model = vehicle_model
@@ -272,102 +577,157 @@ class Vehicle:
             other (object): The object to compare with.
         
         Returns:
-            bool: True if the other object is a Vehicle with the same ID.
+            bool: True if the other object is a Vehicle with the same ID;
+            NotImplemented for non-Vehicle objects.
         """
-        if not isinstance(other, Vehicle):
-            raise TypeError("Only Vehicle instances can be compared.")
+        if self is other:
+            return True
+        if type(other) is not Vehicle:
+            return NotImplemented
         return self.vehicle_id == other.vehicle_id
 
+    def __hash__(self) -> int:
+        """Return the hash of the vehicle ID, computed once at construction."""
+        return self._hash
 
-class BaseParkingSpot(ABC):
-    """Abstract base class for a parking spot."""
-    def __init__(self, spot_id: int) -> None:
+
+@final
+class ParkingSpot:
+    """
+    A parking spot; electric spots only accept electric vehicles.
+    
+    The spot type is fixed at construction, which also binds the spot's
+    park routine. ``kind`` holds the matching internal spot-kind code.
+    """
+    __slots__ = ("spot_id", "vehicle", "kind", "charging_port", "_vehicle_type", "_park")
+
+    def __init__(self, spot_id: int, spot_type: object = "standard", charging_port: bool = False) -> None:
         """
         Initialize a parking spot.
         
         Args:
             spot_id (int): Unique identifier for the spot.
+            spot_type (str, optional): 'standard' or 'electric'. Defaults to 'standard'.
+            charging_port (bool, optional): Indicates presence of a charging port. Defaults to False.
+        
+        Raises:
+            ValueError: If the spot type is unknown.
         """
+        kind = _spot_kind(spot_type)
         self.spot_id = spot_id
         self.vehicle: Optional[Vehicle] = None
+        # Copy of vehicle.vehicle_type, kept in step with vehicle for __repr__.
+        self._vehicle_type: Optional[str] = None
+        self.kind = kind
+        self.charging_port = charging_port
+        # Fills an already checked free spot; chosen once here instead of
+        # branching on kind for every park.
+        self._park: Callable[[ParkingSpot, Vehicle], None] = (
+            _park_electric if kind == _ELECTRIC else _park_standard
+        )
 
     def __repr__(self) -> str:
         """Return a string in the format 'PS# <spot_id>'."""
         return f"PS# {self.spot_id}"
 
+    @property
+    def spot_type(self) -> str:
+        """Return 'electric' or 'standard'."""
+        return "electric" if self.kind == _ELECTRIC else "standard"
+
     @property
     def is_available(self) -> bool:
         """Return True if no vehicle is parked."""
         return self.vehicle is None
 
-    @abstractmethod
-    def park_vehicle(self, vehicle: Vehicle) -> None:
-        """
-        Park a vehicle in the spot.
-        Must be implemented by subclasses.
-        """
-        pass
-
-    def unpark_vehicle(self) -> None:
+    def clone(self) -> ParkingSpot:
         """
-        Remove the parked vehicle.
+        Return a shallow copy of the spot that shares the parked vehicle.
         
-        Raises:
-            RuntimeError: If the spot is already empty.
+        Returns:
+            ParkingSpot: A new spot with the same state.
         """
-        if self.is_available:
-            raise RuntimeError(f"Spot {self.spot_id} is already empty")
-        self.vehicle = None
-
+        new = ParkingSpot(self.spot_id, self.spot_type, self.charging_port)
+        new.vehicle = self.vehicle
+        new._vehicle_type = self._vehicle_type
+        return new
 
-class StandardParkingSpot(BaseParkingSpot):
-    """A standard parking spot for any vehicle."""
-    def park_vehicle(self, vehicle: Vehicle) -> None:
+    def park_vehicle(self, vehicle: object) -> None:
         """
-        Park a vehicle if the spot is free.
+        Park a vehicle if the spot is free and accepts it.
+        
+        For a spot that belongs to a ParkingLot, use the lot's methods; the
+        lot does not see changes made here.
         
         Args:
             vehicle (Vehicle): The vehicle to park.
         
         Raises:
             TypeError: If the vehicle is not a Vehicle instance.
-            ValueError: If the spot is occupied.
+            ValueError: If the spot is occupied, or the vehicle is not electric for an electric spot.
         """
-        if not isinstance(vehicle, Vehicle):
+        if type(vehicle) is not Vehicle:
             raise TypeError("Expected a Vehicle instance.")
-        if not self.is_available:
+        if self.vehicle is not None:
             raise ValueError(f"Spot {self.spot_id} is already occupied.")
-        self.vehicle = vehicle
-
+        self._park(self, vehicle)
 
-class ElectricVehicleParkingSpot(BaseParkingSpot):
-    """A parking spot for electric vehicles with an optional charging port."""
-    def __init__(self, spot_id: int, charging_port: bool = True) -> None:
-        """
-        Initialize an electric vehicle parking spot.
-        
-        Args:
-            spot_id (int): Unique identifier.
-            charging_port (bool, optional): Indicates presence of a charging port. Defaults to True.
-        """
-        super().__init__(spot_id)
-        self.charging_port = charging_port
-
-    def park_vehicle(self, vehicle: Vehicle) -> None:
+    def unpark_vehicle(self) -> None:
         """
-        Park an electric vehicle.
+        Remove the parked vehicle.
         
-        Args:
-            vehicle (Vehicle): The vehicle to park.
+        For a spot that belongs to a ParkingLot, use the lot's methods; the
+        lot does not see changes made here.
         
         Raises:
-            TypeError: If not a Vehicle instance.
-            ValueError: If the vehicle is not electric or the spot is occupied.
+            RuntimeError: If the spot is already empty.
         """
-        if not isinstance(vehicle, Vehicle):
-            raise TypeError("Expected a Vehicle instance.")
-        if vehicle.vehicle_type != "electric":
-            raise ValueError(f"Spot {self.spot_id} supports only electric vehicles.")
-        if not self.is_available:
-            raise ValueError(f"Spot {self.spot_id} is already occupied.")
-        self.vehicle = vehicle
+        if self.vehicle is None:
+            raise RuntimeError(f"Spot {self.spot_id} is already empty")
+        self.vehicle = None
+        self._vehicle_type = None
+
+
+def _park_standard(spot: ParkingSpot, vehicle: Vehicle) -> None:
+    """Fill a free standard spot with an already validated vehicle."""
+    spot.vehicle = vehicle
+    spot._vehicle_type = vehicle.vehicle_type
+
+
+def _park_electric(spot: ParkingSpot, vehicle: Vehicle) -> None:
+    """Fill a free electric spot, enforcing that the vehicle is electric."""
+    if vehicle.vehicle_type != "electric":
+        raise ValueError(f"Spot {spot.spot_id} supports only electric vehicles.")
+    spot.vehicle = vehicle
+    spot._vehicle_type = vehicle.vehicle_type
+
+
+# Kept for code written against the former spot class hierarchy.
+BaseParkingSpot = ParkingSpot
+
+
+def StandardParkingSpot(spot_id: int) -> ParkingSpot:
+    """
+    Create a standard parking spot for any vehicle.
+    
+    Args:
+        spot_id (int): Unique identifier.
+    
+    Returns:
+        ParkingSpot: The new spot.
+    """
+    return ParkingSpot(spot_id)
+
+
+def ElectricVehicleParkingSpot(spot_id: int, charging_port: bool = True) -> ParkingSpot:
+    """
+    Create a parking spot for electric vehicles with an optional charging port.
+    
+    Args:
+        spot_id (int): Unique identifier.
+        charging_port (bool, optional): Indicates presence of a charging port. Defaults to True.
+    
+    Returns:
+        ParkingSpot: The new spot.
+    """
+    return ParkingSpot(spot_id, "electric", charging_port)
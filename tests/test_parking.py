@@ -1,232 +1,546 @@
-import unittest
+import enum
+import re
+
+import pytest
+
 from src.parking import (
+    MAX_SPOT_ID,
     ParkingLot,
+    ParkingSpot,
     StandardParkingSpot,                
     ElectricVehicleParkingSpot,
     Vehicle
 )
 
-class TestVehicle(unittest.TestCase):
-    """Test cases for the Vehicle class."""
-
-    def test_vehicle_creation(self):
-        """Test vehicle initialization and attribute assignments."""
-        vehicle = Vehicle("ABC123", "Sedan", "Toyota", "Corolla", "Blue")
-        self.assertEqual(vehicle.vehicle_id, "ABC123")
-        self.assertEqual(vehicle.vehicle_type, "Sedan")
-        self.assertEqual(vehicle.vehicle_make, "Toyota")
-        self.assertEqual(vehicle.vehicle_model, "Corolla")
-        self.assertEqual(vehicle.vehicle_color, "Blue")
-
-
-class TestStandardParkingSpot(unittest.TestCase):
-    """Test cases for the StandardParkingSpot (aliased as ParkingSpot) class."""
-
-    def setUp(self):
-        """Set up a standard parking spot and a vehicle before each test."""
-        self.spot = StandardParkingSpot(1)
-        self.vehicle = Vehicle("XYZ789", "SUV", "Honda", "CRV", "Red")
-
-    def test_initially_available(self):
-        """Test that a new parking spot is available."""
-        self.assertTrue(self.spot.is_available)
-
-    def test_park_vehicle(self):
-        """Test parking a vehicle in an available spot."""
-        self.spot.park_vehicle(self.vehicle)
-        self.assertFalse(self.spot.is_available)
-        self.assertEqual(self.spot.vehicle, self.vehicle)
-
-    def test_park_vehicle_in_occupied_spot(self):
-        """Test that parking in an occupied spot raises a ValueError."""
-        self.spot.park_vehicle(self.vehicle)
-        with self.assertRaises(ValueError) as context:
-            self.spot.park_vehicle(Vehicle("NEW123", "Truck", "Ford", "F-150", "Black"))
-        self.assertIn("already occupied", str(context.exception))
-
-    def test_unpark_vehicle(self):
-        """Test removing a parked vehicle."""
-        self.spot.park_vehicle(self.vehicle)
-        self.spot.unpark_vehicle()
-        self.assertTrue(self.spot.is_available)
-        self.assertIsNone(self.spot.vehicle)
-
-    def test_unpark_empty_spot(self):
-        """Test that trying to unpark an empty spot raises RuntimeError."""
-        with self.assertRaises(RuntimeError) as context:
-            self.spot.unpark_vehicle()
-        self.assertIn("already empty", str(context.exception))
-
-
-class TestElectricVehicleParkingSpot(unittest.TestCase):
-    """Test cases for the ElectricVehicleParkingSpot class."""
-
-    def setUp(self):
-        """Set up an electric parking spot and sample vehicles before each test."""
-        self.electric_spot = ElectricVehicleParkingSpot(10)
-        # Create an electric vehicle and a non-electric vehicle.
-        self.electric_vehicle = Vehicle("ELECTRO1", "electric", "Tesla", "Model S", "Red")
-        self.non_electric_vehicle = Vehicle("NONEL1", "Sedan", "Toyota", "Camry", "Blue")
-
-    def test_electric_vehicle_parking(self):
-        """Test that an electric vehicle can be parked in an electric spot."""
-        self.electric_spot.park_vehicle(self.electric_vehicle)
-        self.assertFalse(self.electric_spot.is_available)
-        self.assertEqual(self.electric_spot.vehicle, self.electric_vehicle)
-
-    def test_reject_non_electric_vehicle(self):
-        """Test that parking a non-electric vehicle in an electric spot raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.electric_spot.park_vehicle(self.non_electric_vehicle)
-        self.assertIn("supports only electric vehicles", str(context.exception))
-
-    def test_unpark_vehicle(self):
-        """Test removing a parked electric vehicle."""
-        self.electric_spot.park_vehicle(self.electric_vehicle)
-        self.electric_spot.unpark_vehicle()
-        self.assertTrue(self.electric_spot.is_available)
-        self.assertIsNone(self.electric_spot.vehicle)
-
-
-class TestParkingLot(unittest.TestCase):
-    """Test cases for the ParkingLot class."""
-
-    def setUp(self):
-        """Set up a parking lot with a standard and an electric spot before each test."""
-        self.lot = ParkingLot()
-        self.lot.add_spot(1)                      # Standard spot (default)
-        self.lot.add_spot(2, spot_type="electric")  # Electric spot
-        self.vehicle1 = Vehicle("CAR001", "Sedan", "Tesla", "Model 3", "White")
-        self.vehicle2 = Vehicle("CAR002", "SUV", "Jeep", "Wrangler", "Black")
-        self.electric_vehicle = Vehicle("ELECTRO1", "electric", "Nissan", "Leaf", "Green")
-
-    def test_add_spot(self):
-        """Test that adding spots increases the parking lot's size."""
-        self.assertEqual(len(self.lot.parking_spots), 2)
-
-    def test_park_vehicle_in_specific_standard_spot(self):
-        """Test parking a vehicle in a specific standard spot."""
-        self.lot.park_vehicle(self.vehicle1, 1)
-        self.assertFalse(self.lot.parking_spots[1].is_available)
-        self.assertEqual(self.lot.parking_spots[1].vehicle, self.vehicle1)
-
-    def test_park_vehicle_in_specific_electric_spot_with_incorrect_vehicle(self):
-        """Test that parking a non-electric vehicle in an electric spot raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.lot.park_vehicle(self.vehicle1, 2)  # vehicle1 is not electric
-        self.assertIn("supports only electric vehicles", str(context.exception))
-
-    def test_park_electric_vehicle_in_electric_spot(self):
-        """Test that an electric vehicle can be parked in an electric spot."""
-        self.lot.park_vehicle(self.electric_vehicle, 2)
-        self.assertFalse(self.lot.parking_spots[2].is_available)
-        self.assertEqual(self.lot.parking_spots[2].vehicle, self.electric_vehicle)
-
-    def test_park_vehicle_any_available_spot(self):
-        """Test parking a vehicle in any available spot."""
-        self.lot.park_vehicle(self.vehicle1)
-        parked_spots = [spot for spot in self.lot.parking_spots.values() if spot.vehicle is not None]
-        self.assertIn(self.vehicle1, [spot.vehicle for spot in parked_spots])
-
-    def test_park_in_nonexistent_spot(self):
-        """Test that parking in a nonexistent spot raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.lot.park_vehicle(self.vehicle1, 99)
-        self.assertIn("Invalid spot ID: 99", str(context.exception))
-
-    def test_park_in_occupied_spot(self):
-        """Test that parking in an already occupied spot raises ValueError."""
-        self.lot.park_vehicle(self.vehicle1, 1)
-        with self.assertRaises(ValueError) as context:
-            self.lot.park_vehicle(self.vehicle2, 1)
-        self.assertIn("already occupied", str(context.exception))
-
-    def test_park_when_no_spots_available(self):
-        """Test that parking fails when there are no available spots."""
-        self.lot.park_vehicle(self.vehicle1)
-        self.lot.park_vehicle(self.electric_vehicle, 2)
-        with self.assertRaises(RuntimeError) as context:
-            self.lot.park_vehicle(Vehicle("CAR003", "Truck", "Ford", "F-150", "Blue"))
-        self.assertIn("No available spots left", str(context.exception))
-
-    def test_unpark_vehicle(self):
-        """Test successfully removing a parked vehicle."""
-        self.lot.park_vehicle(self.vehicle1, 1)
-        self.lot.unpark_vehicle(self.vehicle1.vehicle_id)
-        self.assertTrue(self.lot.parking_spots[1].is_available)
-
-    def test_unpark_nonexistent_vehicle(self):
-        """Test that removing a nonexistent vehicle raises ValueError."""
-        with self.assertRaises(ValueError) as context:
-            self.lot.unpark_vehicle("NONEXIST")
-        self.assertIn("Vehicle NONEXIST not found", str(context.exception))
-
-    def test_release_spot(self):
-        """Test releasing a parking spot."""
-        self.lot.park_vehicle(self.vehicle1, 1)
-        self.lot.release_spot(1)
-        self.assertTrue(self.lot.parking_spots[1].is_available)
-
-    def test_release_already_empty_spot(self):
-        """Test that releasing an already empty spot raises RuntimeError."""
-        with self.assertRaises(RuntimeError) as context:
-            self.lot.release_spot(1)
-        self.assertIn("already empty", str(context.exception))
-
-
-class TestParkingLotCallbacks(unittest.TestCase):
-    """Test callback functionality in the ParkingLot class."""
-
-    def setUp(self):
-        """Set up a parking lot with one standard spot and an empty callback log."""
-        self.lot = ParkingLot()
-        self.lot.add_spot(1)
-        self.vehicle = Vehicle("CB001", "Sedan", "Honda", "Civic", "Blue")
-        self.callback_results = []
-
-    def callback_vehicle_parked(self, vehicle: Vehicle, spot):
-        """Callback for vehicle parked event."""
-        self.callback_results.append(("vehicle_parked", vehicle.vehicle_id, spot.spot_id))
-
-    def callback_vehicle_unparked(self, vehicle_id: str, spot):
-        """Callback for vehicle unparked event."""
-        self.callback_results.append(("vehicle_unparked", vehicle_id, spot.spot_id))
-
-    def callback_spot_freed(self, spot):
-        """Callback for spot freed event."""
-        self.callback_results.append(("spot_freed", spot.spot_id))
-
-    def test_vehicle_parked_callback(self):
-        """Test that the 'vehicle_parked' callback is invoked correctly."""
-        self.lot.register_callback("vehicle_parked", self.callback_vehicle_parked)
-        self.lot.park_vehicle(self.vehicle, 1)
-        self.assertEqual(len(self.callback_results), 1)
-        event, vid, sid = self.callback_results[0]
-        self.assertEqual(event, "vehicle_parked")
-        self.assertEqual(vid, self.vehicle.vehicle_id)
-        self.assertEqual(sid, 1)
-
-    def test_vehicle_unparked_callback(self):
-        """Test that the 'vehicle_unparked' callback is invoked correctly."""
-        self.lot.register_callback("vehicle_unparked", self.callback_vehicle_unparked)
-        self.lot.park_vehicle(self.vehicle, 1)
-        self.lot.unpark_vehicle(self.vehicle.vehicle_id)
-        self.assertEqual(len(self.callback_results), 1)
-        event, vid, sid = self.callback_results[0]
-        self.assertEqual(event, "vehicle_unparked")
-        self.assertEqual(vid, self.vehicle.vehicle_id)
-        self.assertEqual(sid, 1)
-
-    def test_spot_freed_callback(self):
-        """Test that the 'spot_freed' callback is invoked correctly."""
-        self.lot.register_callback("spot_freed", self.callback_spot_freed)
-        self.lot.park_vehicle(self.vehicle, 1)
-        self.lot.release_spot(1)
-        self.assertEqual(len(self.callback_results), 1)
-        event, sid = self.callback_results[0]
-        self.assertEqual(event, "spot_freed")
-        self.assertEqual(sid, 1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+# Message patterns shared by the pytest.raises(match=...) checks below.
+OCCUPIED = re.compile("already occupied")
+SPOT_1_OCCUPIED = re.compile("Spot 1 is already occupied")
+ELECTRIC_ONLY = re.compile("supports only electric vehicles")
+NEGATIVE_SPOT_ID = re.compile("non-negative integer")
+INVALID_SPOT_ID = re.compile("Invalid spot ID: 99")
+UNKNOWN_SPOT = re.compile("The spot does not exist")
+NO_SPOTS_LEFT = re.compile("No available spots left")
+VEHICLE_NOT_FOUND = re.compile("Vehicle NONEXIST not found")
+
+
+def test_vehicle_creation():
+    """Test vehicle initialization and attribute assignments."""
+    vehicle = Vehicle("ABC123", "Sedan", "Toyota", "Corolla", "Blue")
+    assert vehicle.vehicle_id == "ABC123"
+    assert vehicle.vehicle_type == "Sedan"
+    assert vehicle.vehicle_make == "Toyota"
+    assert vehicle.vehicle_model == "Corolla"
+    assert vehicle.vehicle_color == "Blue"
+
+
+def test_vehicle_equality_and_hash():
+    """Test that vehicles compare and hash by ID and never raise on foreign types."""
+    vehicle = Vehicle("ABC123", "Sedan")
+    same_id = Vehicle("ABC123", "Truck")
+    assert vehicle == same_id
+    assert len({vehicle, same_id}) == 1
+    assert vehicle != "ABC123"
+    assert vehicle not in [None, "ABC123"]
+
+
+@pytest.mark.parametrize("bad_id", ["", "   "], ids=["empty", "whitespace"])
+def test_vehicle_rejects_blank_id(bad_id):
+    """Test that empty or whitespace-only vehicle IDs raise ValueError."""
+    with pytest.raises(ValueError):
+        Vehicle(bad_id, "Sedan")
+
+
+# Vehicles are never mutated by spots or the lot, so each distinct vehicle is
+# built once and shared; spots and lots are rebuilt for every test.
+@pytest.fixture(scope="session")
+def vehicle_factory():
+    """Return a Vehicle constructor that caches instances by their arguments."""
+    cache = {}
+
+    def make(*args):
+        vehicle = cache.get(args)
+        if vehicle is None:
+            vehicle = cache[args] = Vehicle(*args)
+        return vehicle
+
+    return make
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(StandardParkingSpot, "SUV"), (ElectricVehicleParkingSpot, "electric")],
+    ids=["standard", "electric"],
+)
+def spot_case(request):
+    """Provide each spot factory with a vehicle type it accepts."""
+    return request.param
+
+
+@pytest.fixture
+def spot(spot_case):
+    """Build a fresh parking spot of the parametrized type."""
+    spot_cls, _ = spot_case
+    return spot_cls(1)
+
+
+@pytest.fixture(scope="module")
+def vehicle(spot_case, vehicle_factory):
+    """Provide a vehicle the parametrized spot type accepts."""
+    _, vehicle_type = spot_case
+    return vehicle_factory("XYZ789", vehicle_type, "Honda", "CRV", "Red")
+
+
+def test_spot_initially_available(spot):
+    """Test that a new parking spot is available."""
+    assert spot.is_available
+
+
+def test_spot_park_vehicle(spot, vehicle):
+    """Test parking a vehicle in an available spot."""
+    spot.park_vehicle(vehicle)
+    assert not spot.is_available
+    assert spot.vehicle == vehicle
+
+
+def test_spot_park_vehicle_in_occupied_spot(spot, vehicle, vehicle_factory):
+    """Test that parking in an occupied spot raises a ValueError."""
+    spot.park_vehicle(vehicle)
+    with pytest.raises(ValueError, match=SPOT_1_OCCUPIED):
+        spot.park_vehicle(vehicle_factory("NEW123", vehicle.vehicle_type, "Ford", "F-150", "Black"))
+
+
+def test_spot_unpark_vehicle(spot, vehicle):
+    """Test removing a parked vehicle."""
+    spot.park_vehicle(vehicle)
+    spot.unpark_vehicle()
+    assert spot.is_available
+    assert spot.vehicle is None
+
+
+def test_spot_unpark_empty_spot(spot):
+    """Test that trying to unpark an empty spot raises RuntimeError."""
+    with pytest.raises(RuntimeError):
+        spot.unpark_vehicle()
+
+
+def test_electric_spot_rejects_non_electric_vehicle(vehicle_factory):
+    """Test that parking a non-electric vehicle in an electric spot raises ValueError."""
+    electric_spot = ElectricVehicleParkingSpot(10)
+    with pytest.raises(ValueError, match=ELECTRIC_ONLY):
+        electric_spot.park_vehicle(vehicle_factory("NONEL1", "Sedan", "Toyota", "Camry", "Blue"))
+
+
+def test_spot_factories_build_typed_spots():
+    """Test that the spot factories build ParkingSpots of the matching type."""
+    assert StandardParkingSpot(1).spot_type == "standard"
+    assert ElectricVehicleParkingSpot(2).spot_type == "electric"
+    assert type(ElectricVehicleParkingSpot(2)) is ParkingSpot
+
+
+@pytest.mark.parametrize("spot_type", [5, "garage"])
+def test_spot_rejects_unknown_type(spot_type):
+    """Test that a spot cannot be built with an unknown type."""
+    with pytest.raises(ValueError):
+        ParkingSpot(1, spot_type)
+
+
+@pytest.fixture(scope="module")
+def vehicle1(vehicle_factory):
+    """Provide a non-electric vehicle."""
+    return vehicle_factory("CAR001", "Sedan", "Tesla", "Model 3", "White")
+
+
+@pytest.fixture(scope="module")
+def vehicle2(vehicle_factory):
+    """Provide a second non-electric vehicle."""
+    return vehicle_factory("CAR002", "SUV", "Jeep", "Wrangler", "Black")
+
+
+@pytest.fixture(scope="module")
+def electric_vehicle(vehicle_factory):
+    """Provide an electric vehicle."""
+    return vehicle_factory("ELECTRO1", "electric", "Nissan", "Leaf", "Green")
+
+
+def _build_two_spot_lot():
+    """Build a parking lot with a standard and an electric spot."""
+    lot = ParkingLot()
+    lot.add_spot(1)                      # Standard spot (default)
+    lot.add_spot(2, spot_type="electric")  # Electric spot
+    return lot
+
+
+@pytest.fixture(scope="module")
+def shared_lot():
+    """Build the two-spot lot once for tests that only read from it."""
+    return _build_two_spot_lot()
+
+
+@pytest.fixture
+def lot():
+    """Build a fresh two-spot lot for tests that park, unpark or add spots."""
+    return _build_two_spot_lot()
+
+
+def test_add_spot(shared_lot):
+    """Test that adding spots increases the parking lot's size."""
+    assert len(shared_lot.parking_spots) == 2
+    assert shared_lot.available_spots == {1, 2}
+    assert shared_lot.parking_spots.get(99) is None
+
+
+@pytest.mark.parametrize(
+    "bad_id",
+    [-1, "3", True, MAX_SPOT_ID + 1, 10**10],
+    ids=["negative", "str", "bool", "above-max", "huge"],
+)
+def test_add_spot_with_invalid_id(lot, bad_id):
+    """Test that adding a spot with a negative, non-integer or too large ID raises ValueError."""
+    with pytest.raises(ValueError, match=NEGATIVE_SPOT_ID):
+        lot.add_spot(bad_id)
+
+
+def test_add_spot_up_to_max_spot_id(lot, vehicle1):
+    """Test that the largest allowed spot ID can be added and parked in."""
+    lot.add_spot(MAX_SPOT_ID)
+    lot.park_vehicle(vehicle1, MAX_SPOT_ID)
+    assert lot.vehicle_to_spot == {"CAR001": MAX_SPOT_ID}
+    with pytest.raises(ValueError, match=UNKNOWN_SPOT):
+        lot.release_spot(MAX_SPOT_ID + 1)
+
+
+def test_add_spots(lot):
+    """Test adding a batch of spots, skipping IDs that already exist."""
+    added = lot.add_spots(range(1, 5), spot_type="electric")
+    assert [spot.spot_id for spot in added] == [3, 4]
+    assert len(lot.parking_spots) == 4
+    assert lot.parking_spots[4].kind == lot.parking_spots[2].kind
+    assert lot.available_spots == {1, 2, 3, 4}
+
+
+class Level(enum.IntEnum):
+    """Spot IDs named after parking levels."""
+    GROUND = 3
+    ROOF = 4
+
+
+def test_spot_ids_may_be_int_subclasses(lot, vehicle1):
+    """Test that a spot added by an int-subclass ID can be parked in and released by it."""
+    lot.add_spot(Level.GROUND)
+    lot.add_spots([Level.ROOF])
+    lot.park_vehicle(vehicle1, Level.GROUND)
+    assert type(lot.spot_of(vehicle1.vehicle_id).spot_id) is int
+    lot.release_spot(Level.GROUND)
+    assert lot.available_spots == {1, 2, 3, 4}
+
+
+def test_add_spots_with_invalid_id(lot):
+    """Test that one invalid ID rejects the whole batch."""
+    with pytest.raises(ValueError):
+        lot.add_spots([3, -1])
+    assert 3 not in lot.parking_spots
+
+
+def test_park_vehicle_in_specific_standard_spot(lot, vehicle1):
+    """Test parking a vehicle in a specific standard spot."""
+    lot.park_vehicle(vehicle1, 1)
+    assert not lot.parking_spots[1].is_available
+    assert lot.parking_spots[1].vehicle == vehicle1
+
+
+def test_park_electric_vehicle_in_electric_spot(lot, electric_vehicle):
+    """Test that an electric vehicle can be parked in an electric spot."""
+    lot.park_vehicle(electric_vehicle, 2)
+    assert not lot.parking_spots[2].is_available
+    assert lot.parking_spots[2].vehicle == electric_vehicle
+
+
+def test_park_vehicle_any_available_spot(lot, vehicle1):
+    """Test parking a vehicle in any available spot."""
+    lot.park_vehicle(vehicle1)
+    assert lot.spot_of(vehicle1.vehicle_id).vehicle is vehicle1
+
+
+def test_park_vehicle_takes_lowest_available_spot(lot, vehicle1, vehicle2):
+    """Test that automatic assignment picks the free spot with the lowest ID."""
+    lot.add_spot(0)
+    lot.park_vehicle(vehicle1)
+    assert lot.vehicle_to_spot[vehicle1.vehicle_id] == 0
+    lot.park_vehicle(vehicle2)
+    assert lot.vehicle_to_spot[vehicle2.vehicle_id] == 1
+    assert lot.available_spots == {2}
+
+
+def test_park_vehicle_farthest_first(vehicle1, vehicle2):
+    """Test that the 'farthest' policy assigns the free spot with the highest ID."""
+    lot = ParkingLot(allocation="farthest")
+    for spot_id in range(3):
+        lot.add_spot(spot_id)
+    lot.park_vehicle(vehicle1)
+    lot.park_vehicle(vehicle2)
+    assert lot.vehicle_to_spot[vehicle1.vehicle_id] == 2
+    assert lot.vehicle_to_spot[vehicle2.vehicle_id] == 1
+
+
+def test_lot_without_locking(vehicle1):
+    """Test that a lot created with thread_safe=False behaves the same."""
+    lot = ParkingLot(thread_safe=False)
+    lot.add_spot(1)
+    lot.park_vehicle(vehicle1)
+    lot.unpark_vehicle(vehicle1.vehicle_id)
+    assert lot.available_spots == {1}
+
+
+def test_unknown_allocation_policy():
+    """Test that an unknown allocation policy raises ValueError."""
+    with pytest.raises(ValueError):
+        ParkingLot(allocation="random")
+
+
+def test_park_vehicle_skips_electric_spots_for_other_vehicles(lot, vehicle1, vehicle2):
+    """Test that automatic assignment never offers an electric spot to a non-electric vehicle."""
+    lot.add_spot(0, spot_type="electric")
+    lot.park_vehicle(vehicle1)
+    assert lot.vehicle_to_spot[vehicle1.vehicle_id] == 1
+    with pytest.raises(RuntimeError):
+        lot.park_vehicle(vehicle2)
+
+
+def test_park_electric_vehicle_prefers_electric_spot(lot, electric_vehicle):
+    """Test that automatic assignment gives electric vehicles an electric spot first."""
+    lot.park_vehicle(electric_vehicle)
+    assert lot.vehicle_to_spot[electric_vehicle.vehicle_id] == 2
+
+
+def test_park_vehicles(lot, vehicle1, electric_vehicle):
+    """Test parking a batch of vehicles in automatically assigned spots."""
+    lot.park_vehicles([vehicle1, electric_vehicle])
+    assert lot.vehicle_to_spot == {"CAR001": 1, "ELECTRO1": 2}
+
+
+def test_park_vehicles_from_generator_that_reads_lot(lot, vehicle1, electric_vehicle):
+    """Test that the batch iterable may query the lot without deadlocking."""
+    seen = []
+
+    def arrivals():
+        for vehicle in (vehicle1, electric_vehicle):
+            seen.append(lot.available_spots)
+            yield vehicle
+
+    lot.park_vehicles(arrivals())
+    assert seen == [{1, 2}, {1, 2}]
+    assert lot.vehicle_to_spot == {"CAR001": 1, "ELECTRO1": 2}
+
+
+def test_park_vehicles_stops_at_first_failure(lot, vehicle1, vehicle2):
+    """Test that a failing batch keeps the vehicles parked before the failure."""
+    with pytest.raises(RuntimeError):
+        lot.park_vehicles([vehicle1, vehicle2])
+    assert lot.vehicle_to_spot == {"CAR001": 1}
+
+
+def _failing_callback(seen):
+    """Return a callback that records the parked vehicle's ID and raises."""
+    def callback(vehicle, spot):
+        seen.append(vehicle.vehicle_id)
+        raise ZeroDivisionError
+    return callback
+
+
+def test_park_vehicles_failure_survives_raising_callback(lot, vehicle1, vehicle2, electric_vehicle):
+    """Test that a raising callback neither hides the parking error nor skips events."""
+    seen = []
+    lot.register_callback("vehicle_parked", _failing_callback(seen))
+    with pytest.raises(RuntimeError, match=NO_SPOTS_LEFT):
+        lot.park_vehicles([vehicle1, electric_vehicle, vehicle2])
+    assert seen == ["CAR001", "ELECTRO1"]
+
+
+def test_park_vehicles_reports_callback_error_after_all_events(lot, vehicle1, electric_vehicle):
+    """Test that a callback error is raised once every parked vehicle's event has fired."""
+    seen = []
+    lot.register_callback("vehicle_parked", _failing_callback(seen))
+    with pytest.raises(ZeroDivisionError):
+        lot.park_vehicles([vehicle1, electric_vehicle])
+    assert seen == ["CAR001", "ELECTRO1"]
+
+
+@pytest.mark.parametrize(
+    "setup, action, exc, msg",
+    [
+        pytest.param(
+            None, lambda lot, v: lot.park_vehicle(v["vehicle1"], 2), ValueError, ELECTRIC_ONLY,
+            id="non-electric-in-electric-spot",
+        ),
+        pytest.param(
+            None, lambda lot, v: lot.park_vehicle("CAR001", 1), TypeError, None,
+            id="not-a-vehicle",
+        ),
+        pytest.param(
+            None, lambda lot, v: lot.park_vehicle(v["vehicle1"], 99), ValueError, INVALID_SPOT_ID,
+            id="nonexistent-spot",
+        ),
+        pytest.param(
+            lambda lot, v: lot.park_vehicle(v["vehicle1"], 1),
+            lambda lot, v: lot.park_vehicle(v["vehicle2"], 1), ValueError, OCCUPIED,
+            id="occupied-spot",
+        ),
+        pytest.param(
+            lambda lot, v: lot.park_vehicles([v["vehicle1"], v["electric_vehicle"]]),
+            lambda lot, v: lot.park_vehicle(v["vehicle2"]), RuntimeError, NO_SPOTS_LEFT,
+            id="no-spots-available",
+        ),
+        pytest.param(
+            None, lambda lot, v: lot.unpark_vehicle("NONEXIST"), ValueError, VEHICLE_NOT_FOUND,
+            id="unpark-nonexistent-vehicle",
+        ),
+        pytest.param(
+            None, lambda lot, v: lot.release_spot(1), RuntimeError, None,
+            id="release-empty-spot",
+        ),
+    ],
+)
+def test_lot_error_paths(lot, vehicle1, vehicle2, electric_vehicle, setup, action, exc, msg):
+    """Test that each invalid lot operation raises the expected error."""
+    # msg is only given where the method raises exc from more than one site.
+    # setup and action take the lot and the vehicle fixtures by name.
+    vehicles = {"vehicle1": vehicle1, "vehicle2": vehicle2, "electric_vehicle": electric_vehicle}
+    if setup is not None:
+        setup(lot, vehicles)
+    with pytest.raises(exc, match=msg):
+        action(lot, vehicles)
+
+
+@pytest.mark.parametrize("bad_id", ["1", [1]], ids=["str", "unhashable"])
+def test_lot_rejects_non_int_spot_ids(lot, vehicle1, bad_id):
+    """Test that spot IDs that are not ints raise ValueError, even unhashable ones."""
+    with pytest.raises(ValueError, match=UNKNOWN_SPOT):
+        lot.park_vehicle(vehicle1, bad_id)
+    with pytest.raises(ValueError):
+        lot.release_spot(bad_id)
+
+
+@pytest.mark.parametrize("bad_id", [1.0, True], ids=["float", "bool"])
+def test_park_vehicle_with_non_int_spot_id_leaves_lot_unchanged(lot, vehicle1, vehicle2, bad_id):
+    """Test that a spot ID that only hashes like an int neither fills nor hides the spot."""
+    with pytest.raises(ValueError, match=UNKNOWN_SPOT):
+        lot.park_vehicle(vehicle1, bad_id)
+    assert lot.vehicle_to_spot == {}
+    assert lot.available_spots == {1, 2}
+    lot.park_vehicle(vehicle2)
+    assert lot.vehicle_to_spot == {"CAR002": 1}
+
+
+def test_unpark_vehicle(lot, vehicle1):
+    """Test successfully removing a parked vehicle."""
+    lot.park_vehicle(vehicle1, 1)
+    lot.unpark_vehicle(vehicle1.vehicle_id)
+    assert lot.parking_spots[1].is_available
+
+
+def test_release_spot(lot, vehicle1):
+    """Test releasing a parking spot."""
+    lot.park_vehicle(vehicle1, 1)
+    lot.release_spot(1)
+    assert lot.parking_spots[1].is_available
+    assert lot.spot_of(vehicle1.vehicle_id) is None
+    lot.park_vehicle(vehicle1, 1)
+
+
+def test_release_spot_parked_outside_the_lot(lot, vehicle1):
+    """Test that releasing a spot the lot has no record of still frees it cleanly."""
+    lot.parking_spots[1].park_vehicle(vehicle1)
+    lot.release_spot(1)
+    assert lot.parking_spots[1].is_available
+    assert lot.vehicle_to_spot == {}
+
+
+def test_repr_reflects_changes(lot, vehicle1):
+    """Test that the lot's representation is refreshed after each change."""
+    assert repr(lot) == "-----------\n1: empty\n2: empty\n-----------"
+    lot.park_vehicle(vehicle1, 1)
+    assert repr(lot) == "-----------\n1: Sedan\n2: empty\n-----------"
+    lot.release_spot(1)
+    assert repr(lot) == "-----------\n1: empty\n2: empty\n-----------"
+
+
+def test_take_snapshot(lot, electric_vehicle):
+    """Test that a snapshot is unaffected by later changes to the lot."""
+    lot.park_vehicle(electric_vehicle, 2)
+    snapshot = lot.take_snapshot()
+    lot.unpark_vehicle(electric_vehicle.vehicle_id)
+    assert snapshot[2].kind == lot.parking_spots[2].kind
+    assert snapshot[2].vehicle is electric_vehicle
+    assert snapshot[1].is_available
+    assert lot.parking_spots[2].is_available
+
+
+@pytest.fixture
+def single_spot_lot():
+    """Build a parking lot with one standard spot."""
+    lot = ParkingLot()
+    lot.add_spot(1)
+    return lot
+
+
+@pytest.fixture(scope="module")
+def callback_vehicle(vehicle_factory):
+    """Provide the vehicle used by the callback tests."""
+    return vehicle_factory("CB001", "Sedan", "Honda", "Civic", "Blue")
+
+
+def test_vehicle_parked_callback(single_spot_lot, callback_vehicle):
+    """Test that the 'vehicle_parked' callback is invoked correctly."""
+    results = []
+    single_spot_lot.register_callback(
+        "vehicle_parked",
+        lambda vehicle, spot: results.append((vehicle.vehicle_id, spot.spot_id)),
+    )
+    single_spot_lot.park_vehicle(callback_vehicle, 1)
+    assert results == [(callback_vehicle.vehicle_id, 1)]
+
+
+def test_vehicle_unparked_callback(single_spot_lot, callback_vehicle):
+    """Test that the 'vehicle_unparked' callback is invoked correctly."""
+    results = []
+    single_spot_lot.register_callback(
+        "vehicle_unparked",
+        lambda vehicle_id, spot: results.append((vehicle_id, spot.spot_id)),
+    )
+    single_spot_lot.park_vehicle(callback_vehicle, 1)
+    single_spot_lot.unpark_vehicle(callback_vehicle.vehicle_id)
+    assert results == [(callback_vehicle.vehicle_id, 1)]
+
+
+def test_spot_freed_callback(single_spot_lot, callback_vehicle):
+    """Test that the 'spot_freed' callback is invoked correctly."""
+    results = []
+    single_spot_lot.register_callback("spot_freed", lambda spot: results.append(spot.spot_id))
+    single_spot_lot.park_vehicle(callback_vehicle, 1)
+    single_spot_lot.release_spot(1)
+    assert results == [1]
+
+
+def test_unregister_callback(single_spot_lot, callback_vehicle):
+    """Test that an unregistered callback is no longer invoked."""
+    results = []
+
+    def on_spot_freed(spot):
+        results.append(spot.spot_id)
+
+    single_spot_lot.register_callback("spot_freed", on_spot_freed)
+    single_spot_lot.unregister_callback("spot_freed", on_spot_freed)
+    single_spot_lot.park_vehicle(callback_vehicle, 1)
+    single_spot_lot.release_spot(1)
+    assert results == []
+
+
+def test_callback_can_query_lot(single_spot_lot, callback_vehicle):
+    """Test that a callback may call back into the lot without deadlocking."""
+    results = []
+    single_spot_lot.register_callback(
+        "vehicle_parked",
+        lambda vehicle, spot: results.append(single_spot_lot.available_spots),
+    )
+    single_spot_lot.park_vehicle(callback_vehicle, 1)
+    assert results == [set()]